@@ -44,9 +44,15 @@ its primary image.  To append photos to an existing album instead, pass the
 from __future__ import annotations
 
 import argparse
+import functools
+import sqlite3
 import sys
+import threading
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from difflib import SequenceMatcher
+from typing import Iterable, Iterator, List, Optional, Tuple
+from xml.etree.ElementTree import Element
 
 import flickrapi
 
@@ -59,7 +65,125 @@ import flickrapi
 API_KEY: str = ""
 API_SECRET: str = ""
 
+# Flickr caps any single photos.search query at this many results; queries
+# matching more photos must be split into smaller date windows.
+MAX_SEARCH_RESULTS: int = 4000
 
+# Deletion table used to normalize camera model strings for comparison:
+# "Canon EOS 7D Mark II", "canon-eos-7d-mark-ii" and "canoneos7dmarkii" all
+# normalize to the same key.  A single str.translate pass with this table
+# replaces three chained str.replace calls (and their intermediate strings).
+_STRIP = str.maketrans('', '', ' -_')
+
+# Minimum SequenceMatcher ratio for two normalized model strings to be
+# considered the same camera.
+_FUZZY_MATCH_CUTOFF = 0.85
+
+# Camera models are immutable per photo, so EXIF lookups are cached on disk
+# and survive across runs.  Delete this file to force fresh lookups.
+EXIF_CACHE_PATH: str = "exif_cache.sqlite"
+
+# A single shared connection is used from the EXIF worker threads, so all
+# access goes through this lock.
+_exif_cache_lock = threading.Lock()
+_exif_cache_conn: Optional[sqlite3.Connection] = None
+
+
+class TokenBucket:
+    """A simple thread-safe token bucket for rate limiting API calls.
+
+    Flickr allows 3,600 requests per hour — one per second on average —
+    but short bursts are fine.  The bucket refills at ``rate`` tokens per
+    second up to ``capacity``; ``acquire`` returns immediately while tokens
+    remain and only blocks once the burst allowance is spent.  This lets
+    small jobs run at full network speed, unlike a fixed ``time.sleep``
+    between calls which penalises every request equally.
+
+    Parameters
+    ----------
+    rate : float
+        Sustained rate in tokens (requests) per second.
+    capacity : int
+        Maximum number of tokens the bucket can hold, i.e. the burst size.
+    """
+
+    def __init__(self, rate: float = 1.0, capacity: int = 10) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Shared limiter for every Flickr API call made by this script, including
+# those issued from the EXIF worker threads.
+_rate_bucket = TokenBucket(rate=1.0, capacity=10)
+
+
+def call_api(fn, **kwargs):
+    """Invoke a Flickr API method through the shared rate limiter.
+
+    Transient failures — Flickr returning 429 (rate limited) or 503
+    (overloaded) — are retried with exponential backoff; other errors
+    propagate to the caller unchanged.
+
+    Parameters
+    ----------
+    fn : callable
+        A bound API method such as ``flickr.photos.search``.
+    **kwargs
+        Arguments forwarded to the API method.
+
+    Returns
+    -------
+    The API method's response.
+    """
+    delay = 1.0
+    for attempt in range(5):
+        _rate_bucket.acquire()
+        try:
+            return fn(**kwargs)
+        except flickrapi.exceptions.FlickrError as exc:
+            code = getattr(exc, 'code', None)
+            if code not in (429, 503) or attempt == 4:
+                raise
+            time.sleep(delay)
+            delay *= 2
+
+
+def _exif_cache() -> sqlite3.Connection:
+    """Return the shared EXIF cache connection, creating it on first use.
+
+    The database is opened in autocommit mode with WAL journalling so that
+    reads and writes interleave cleanly under the thread pool used by
+    ``filter_photos_by_camera``.  Callers must hold ``_exif_cache_lock``.
+    """
+    global _exif_cache_conn
+    if _exif_cache_conn is None:
+        conn = sqlite3.connect(EXIF_CACHE_PATH, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS exif_cache ("
+            "photo_id TEXT PRIMARY KEY, model TEXT, fetched_at INTEGER)"
+        )
+        _exif_cache_conn = conn
+    return _exif_cache_conn
+
+
+@functools.lru_cache(maxsize=4)
 def authenticate(api_key: str, api_secret: str, perms: str = "write") -> flickrapi.FlickrAPI:
     """Authenticate with Flickr and return an authorised FlickrAPI instance.
 
@@ -68,6 +192,10 @@ def authenticate(api_key: str, api_secret: str, perms: str = "write") -> flickra
     authorisation and store the resulting token on disk【141522280467382†L50-L60】.  If a
     valid token exists from a previous session then no browser will be opened.
 
+    The authenticated instance is memoized per ``(api_key, api_secret,
+    perms)``, so when this module is imported as a library repeated calls
+    return the same object without re-checking the on-disk token store.
+
     Parameters
     ----------
     api_key : str
@@ -84,7 +212,11 @@ def authenticate(api_key: str, api_secret: str, perms: str = "write") -> flickra
     flickrapi.FlickrAPI
         An authenticated Flickr API object.
     """
-    flickr = flickrapi.FlickrAPI(api_key, api_secret, format='parsed-json')
+    # The 'etree' response format parses only what we read: photo fields are
+    # accessed as XML attributes (a C-level lookup) instead of materializing
+    # a nested dict per photo, which matters when scanning thousands of
+    # 500-photo pages.
+    flickr = flickrapi.FlickrAPI(api_key, api_secret, format='etree')
     # Try to authenticate via stored token; if it fails, open the browser.
     if not flickr.token_valid(perms=perms):
         # Get a request token and authorise the application in the user's browser.
@@ -92,18 +224,78 @@ def authenticate(api_key: str, api_secret: str, perms: str = "write") -> flickra
     return flickr
 
 
-def search_photos_by_user(flickr: flickrapi.FlickrAPI, user_id: str, extras: str = "machine_tags", per_page: int = 500) -> List[Dict[str, str]]:
-    """Retrieve all public photos for a given user.
+def _search_range(flickr: flickrapi.FlickrAPI, user_id: str, min_upload: int, max_upload: int, extras: str, per_page: int) -> Iterator[Element]:
+    """Search one upload-date window, bisecting it if it exceeds the cap.
+
+    Flickr silently caps any single ``photos.search`` query at
+    ``MAX_SEARCH_RESULTS`` results — pages beyond the cap just repeat
+    earlier photos.  When a window's reported total exceeds the cap, it is
+    split at its midpoint and each half is searched recursively, so every
+    photo is enumerated exactly by some sufficiently small window.
+
+    Parameters
+    ----------
+    flickr : flickrapi.FlickrAPI
+        Authenticated Flickr API instance.
+    user_id : str
+        Flickr NSID of the user whose photos should be searched.
+    min_upload, max_upload : int
+        Inclusive upload-date window as Unix epoch seconds.
+    extras : str
+        Comma‑separated list of extra fields to return.
+    per_page : int
+        Number of results per page; maximum 500.
 
-    Flickr limits searches to a maximum of 4,000 results.  The `per_page`
-    argument controls the number of results returned per API call (maximum
-    500).  This function iterates through pages until all results are
-    collected.
+    Yields
+    ------
+    Element
+        ``<photo>`` elements for every photo uploaded in the window, one
+        page at a time.  Metadata is read via attribute access, e.g.
+        ``photo.get('id')``.
+    """
+    response = call_api(flickr.photos.search, user_id=user_id, extras=extras,
+                        per_page=per_page, page=1,
+                        min_upload_date=min_upload, max_upload_date=max_upload)
+    photos = response.find('photos')
+    total = int(photos.get('total'))
+    if total > MAX_SEARCH_RESULTS and max_upload - min_upload > 1:
+        mid = (min_upload + max_upload) // 2
+        yield from _search_range(flickr, user_id, min_upload, mid, extras, per_page)
+        yield from _search_range(flickr, user_id, mid + 1, max_upload, extras, per_page)
+        return
+    yield from photos.findall('photo')
+    pages = int(photos.get('pages'))
+    for page in range(2, pages + 1):
+        response = call_api(flickr.photos.search, user_id=user_id, extras=extras,
+                            per_page=per_page, page=page,
+                            min_upload_date=min_upload, max_upload_date=max_upload)
+        yield from response.find('photos').findall('photo')
+
+
+def iter_photos_by_user(flickr: flickrapi.FlickrAPI, user_id: str, extras: str = "machine_tags,tags,description,camera", per_page: int = 500) -> Iterator[Element]:
+    """Yield all public photos for a given user, page by page.
+
+    Flickr limits searches to a maximum of 4,000 results, so a plain
+    paginated search silently drops photos for users with larger
+    photostreams.  To enumerate everything, the user's photos are searched
+    by upload-date window — seeded with their first upload date from
+    ``people.getInfo`` — and any window exceeding the cap is bisected (see
+    ``_search_range``).  The `per_page` argument controls the number of
+    results returned per API call (maximum 500).
+
+    Photos are yielded as they are fetched rather than materialized into
+    one big list, so peak memory stays bounded to roughly one page and
+    downstream filtering overlaps with pagination.
 
     We request the ``machine_tags`` extra so that each photo's machine tags
     are returned in the search response【688176185541402†L301-L307】.  Machine tags are
     structured, colon‑separated tags that Flickr generates from EXIF data
     (for example ``camera:model=e-m1markii`` or ``exif:model=Canon EOS 7D Mark II``).
+    The free-form ``tags`` field is requested as well, since many users tag
+    photos with the camera name directly (e.g. ``canoneos7dmarkii``), and
+    the ``camera`` extra returns the camera model straight from the search
+    payload — the more metadata the search returns, the more photos the
+    local filter can settle without a per-photo EXIF call.
 
     Parameters
     ----------
@@ -114,29 +306,26 @@ def search_photos_by_user(flickr: flickrapi.FlickrAPI, user_id: str, extras: str
         ``me`` can be used to search the authenticated user's photos【688176185541402†L54-L56】.
     extras : str
         Comma‑separated list of extra fields to return.  Default is
-        ``machine_tags``【688176185541402†L301-L307】.
+        ``machine_tags,tags,description,camera``【688176185541402†L301-L307】.
     per_page : int
         Number of results per page; maximum 500.
 
-    Returns
-    -------
-    List[Dict[str, str]]
-        A list of dictionaries representing photo metadata returned by
+    Yields
+    ------
+    Element
+        ``<photo>`` elements representing photo metadata returned by
         ``flickr.photos.search``.
     """
-    photos: List[Dict[str, str]] = []
-    page = 1
-    while True:
-        response = flickr.photos.search(user_id=user_id, extras=extras, per_page=per_page, page=page)
-        photos_page = response['photos']['photo']
-        photos.extend(photos_page)
-        # Pagination: if we've reached the last page, break.
-        if page >= int(response['photos']['pages']):
-            break
-        page += 1
-        # Respect Flickr's rate limits by sleeping briefly between requests
-        time.sleep(1)
-    return photos
+    info = call_api(flickr.people.getInfo, user_id=user_id)
+    first_upload = int(info.find('person').find('photos').find('firstdate').text)
+    # Bisected windows can overlap at their boundaries, so deduplicate on
+    # photo ID while preserving order.
+    seen: set = set()
+    for photo in _search_range(flickr, user_id, first_upload, int(time.time()), extras, per_page):
+        photo_id = photo.get('id')
+        if photo_id not in seen:
+            seen.add(photo_id)
+            yield photo
 
 
 def get_camera_for_photo(flickr: flickrapi.FlickrAPI, photo_id: str) -> Optional[str]:
@@ -147,6 +336,11 @@ def get_camera_for_photo(flickr: flickrapi.FlickrAPI, photo_id: str) -> Optional
     its ``raw`` value is returned.  If the photo's owner has disabled EXIF
     sharing, or no Model tag is present, the function returns ``None``.
 
+    Results (including ``None``) are cached in ``EXIF_CACHE_PATH`` keyed by
+    photo ID, since a photo's camera model never changes.  Subsequent runs
+    over the same photostream read the local cache instead of issuing an
+    HTTP request per photo.
+
     Parameters
     ----------
     flickr : flickrapi.FlickrAPI
@@ -160,59 +354,134 @@ def get_camera_for_photo(flickr: flickrapi.FlickrAPI, photo_id: str) -> Optional
         The camera model string (for example "Canon EOS 7D Mark II"), or
         ``None`` if not found.
     """
+    with _exif_cache_lock:
+        row = _exif_cache().execute(
+            "SELECT model FROM exif_cache WHERE photo_id = ?", (photo_id,)
+        ).fetchone()
+    if row is not None:
+        return row[0]
+    model: Optional[str] = None
     try:
-        exif = flickr.photos.getExif(photo_id=photo_id)
+        exif = call_api(flickr.photos.getExif, photo_id=photo_id)
     except flickrapi.exceptions.FlickrError:
         # The photo may not have publicly available EXIF data.
-        return None
-    tags = exif.get('photo', {}).get('exif', [])
-    for tag in tags:
-        # The 'tag' key holds the numeric tag code, 'label' holds the human
-        # friendly name.  We check both to be thorough.
-        if tag.get('label', '').lower() == 'model' or tag.get('tag', '').lower() == 'model':
-            raw = tag.get('raw')
-            if isinstance(raw, dict):
-                return raw.get('_content')
-            else:
-                return raw
-    return None
-
-
-def filter_photos_by_camera(flickr: flickrapi.FlickrAPI, photos: List[Dict[str, str]], camera_model: str) -> List[str]:
-    """Filter a list of photos by camera model.
+        exif = None
+    if exif is not None:
+        # Index the tags by lowercased name instead of scanning the 30-60
+        # entry list per field of interest.  The 'tag' attribute holds the
+        # EXIF tag name, 'label' holds the human friendly name; both are
+        # indexed to be thorough, with the first occurrence winning.
+        tag_index: dict = {}
+        for tag in exif.find('photo').findall('exif'):
+            tag_index.setdefault((tag.get('label') or '').lower(), tag)
+            tag_index.setdefault((tag.get('tag') or '').lower(), tag)
+        model_tag = tag_index.get('model')
+        if model_tag is not None:
+            raw = model_tag.find('raw')
+            if raw is not None:
+                model = raw.text
+    with _exif_cache_lock:
+        _exif_cache().execute(
+            "INSERT OR REPLACE INTO exif_cache (photo_id, model, fetched_at) VALUES (?, ?, ?)",
+            (photo_id, model, int(time.time())),
+        )
+    return model
+
+
+def _model_matches(normalized_target: str, model: str) -> bool:
+    """Return True if a camera model string matches the normalized target.
+
+    Camera model strings vary between EXIF, Flickr's camera field and what
+    users type ("Canon EOS 7D Mark II" vs "EOS 7D Mark II" vs
+    "Canon 7D MkII"), so an exact comparison silently drops matches and
+    forces users to re-run the whole scan with a different
+    ``--camera-model`` string.  A match is accepted when either normalized
+    string contains the other, or their ``SequenceMatcher`` similarity
+    reaches ``_FUZZY_MATCH_CUTOFF``.
+
+    Parameters
+    ----------
+    normalized_target : str
+        The requested camera model, already lowercased and passed through
+        ``_STRIP``.
+    model : str
+        The candidate camera model string, unnormalized.
+
+    Returns
+    -------
+    bool
+        Whether the candidate should be treated as the requested camera.
+    """
+    candidate = model.lower().translate(_STRIP)
+    if normalized_target in candidate or candidate in normalized_target:
+        return True
+    return SequenceMatcher(None, normalized_target, candidate).ratio() >= _FUZZY_MATCH_CUTOFF
+
+
+def filter_photos_by_camera(flickr: flickrapi.FlickrAPI, photos: Iterable[Element], camera_model: str, max_workers: int = 12) -> List[str]:
+    """Filter an iterable of photos by camera model.
+
+    The filter runs in two passes.  A fast in-process pass checks the
+    ``camera`` field returned by the search, then each photo's machine tags
+    and free-form tags; photos none of those can settle are collected
+    and their EXIF data is fetched concurrently on a thread pool.  The EXIF
+    calls are blocking HTTPS round-trips, so running them on ``max_workers``
+    threads cuts wall time roughly linearly (the GIL is released during
+    socket I/O).
 
     Parameters
     ----------
     flickr : flickrapi.FlickrAPI
         Authenticated Flickr API instance.
-    photos : List[Dict[str, str]]
-        Photo metadata objects as returned by ``search_photos_by_user``.
+    photos : Iterable[Element]
+        ``<photo>`` elements as yielded by ``iter_photos_by_user``; any
+        iterable works, so pagination can stream straight into the filter.
     camera_model : str
         The camera model to match, e.g. "Canon EOS 7D Mark II".  Matching is
-        case‑insensitive.
+        case‑insensitive, ignores spaces, hyphens and underscores, and
+        tolerates minor naming variations (see ``_model_matches``).
+    max_workers : int
+        Number of threads used for the concurrent EXIF lookups.
 
     Returns
     -------
     List[str]
-        A list of photo IDs that match the requested camera model.
+        A list of photo IDs that match the requested camera model.  Machine
+        tag matches come first, followed by EXIF matches, each group in the
+        order the photos were supplied.
     """
+    # The target normalization is invariant, so compute it once rather than
+    # per photo.
+    normalized_target = camera_model.lower().translate(_STRIP)
     matching_ids: List[str] = []
+    exif_candidates: List[str] = []
     for photo in photos:
-        photo_id = photo['id']
-        # Attempt to determine the camera model from machine tags first.  Many
-        # photos include structured tags like "camera:model=eos_7d_mark_ii" or
-        # "exif:model=Canon EOS 7D Mark II" in their machine_tags field.  This
-        # avoids extra API calls when available.
-        machine_tags = photo.get('machine_tags', '') or ''
-        if machine_tags:
-            lower_tags = machine_tags.lower()
-            if camera_model.lower().replace(' ', '').replace('-', '').replace('_', '') in lower_tags.replace(' ', '').replace('-', '').replace('_', ''):
+        photo_id = photo.get('id')
+        # The 'camera' extra returns the camera model directly in the search
+        # payload, which is authoritative — when it's present there is never
+        # a reason to consult tags or EXIF.
+        camera = photo.get('camera') or ''
+        if camera:
+            if _model_matches(normalized_target, camera):
+                matching_ids.append(photo_id)
+            continue
+        # Attempt to determine the camera model from tags next.  Many photos
+        # include structured machine tags like "camera:model=eos_7d_mark_ii"
+        # or "exif:model=Canon EOS 7D Mark II", and users often add free-form
+        # tags naming the camera (e.g. "canoneos7dmarkii").  Either settles
+        # the question without an extra API call.
+        local_tags = ' '.join(filter(None, (photo.get('machine_tags'), photo.get('tags'))))
+        if local_tags:
+            if normalized_target in local_tags.lower().translate(_STRIP):
                 matching_ids.append(photo_id)
                 continue
-        # Fallback to EXIF data if machine tags aren't present or don't match.
-        model = get_camera_for_photo(flickr, photo_id)
-        if model and model.lower() == camera_model.lower():
-            matching_ids.append(photo_id)
+        # Fall back to EXIF data if the tags aren't present or don't match.
+        exif_candidates.append(photo_id)
+    if exif_candidates:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            models = executor.map(lambda pid: get_camera_for_photo(flickr, pid), exif_candidates)
+            matching_ids.extend(pid for pid, model in zip(exif_candidates, models)
+                                if model and _model_matches(normalized_target, model))
     return matching_ids
 
 
@@ -238,31 +507,73 @@ def create_photoset(flickr: flickrapi.FlickrAPI, title: str, primary_photo_id: s
     str
         The newly created photoset's ID.
     """
-    resp = flickr.photosets.create(title=title, primary_photo_id=primary_photo_id, description=description)
-    return resp['photoset']['id']
+    resp = call_api(flickr.photosets.create, title=title, primary_photo_id=primary_photo_id, description=description)
+    return resp.find('photoset').get('id')
+
+
+def get_photoset_photos(flickr: flickrapi.FlickrAPI, photoset_id: str, per_page: int = 500) -> Tuple[str, List[str]]:
+    """Return the primary photo ID and member photo IDs of a photoset.
 
+    The membership is fetched with ``flickr.photosets.getPhotos``, paging
+    through the results ``per_page`` at a time.  The order of the returned
+    IDs matches the photoset's current ordering.
 
-def add_photos_to_photoset(flickr: flickrapi.FlickrAPI, photoset_id: str, photo_ids: List[str]) -> None:
-    """Add a list of photos to an existing photoset.
+    Parameters
+    ----------
+    flickr : flickrapi.FlickrAPI
+        Authenticated Flickr API instance.
+    photoset_id : str
+        ID of the photoset to inspect.
+    per_page : int
+        Number of results per page; maximum 500.
 
-    Each photo is added individually using ``flickr.photosets.addPhoto``【801413100068362†L40-L55】.
-    Note that this method returns an empty response upon success【801413100068362†L59-L60】.
+    Returns
+    -------
+    Tuple[str, List[str]]
+        The photoset's primary photo ID and the ordered list of member
+        photo IDs.
+    """
+    # The primary ID and page count are the same on every page, so read them
+    # once from the first response rather than re-parsing per iteration.
+    response = call_api(flickr.photosets.getPhotos, photoset_id=photoset_id, per_page=per_page, page=1)
+    photoset = response.find('photoset')
+    primary_id = photoset.get('primary') or ''
+    pages = int(photoset.get('pages'))
+    photo_ids = [photo.get('id') for photo in photoset.findall('photo')]
+    for page in range(2, pages + 1):
+        response = call_api(flickr.photosets.getPhotos, photoset_id=photoset_id, per_page=per_page, page=page)
+        photo_ids.extend(photo.get('id') for photo in response.find('photoset').findall('photo'))
+    return primary_id, photo_ids
+
+
+def add_photos_to_photoset(flickr: flickrapi.FlickrAPI, photoset_id: str, primary_photo_id: str, photo_ids: List[str]) -> None:
+    """Set a photoset's membership in a single batch call.
+
+    Rather than adding photos one at a time with ``flickr.photosets.addPhoto``
+    (one HTTP round-trip per photo), this uses ``flickr.photosets.editPhotos``
+    to replace the set's full membership atomically in one request.  The
+    caller must therefore pass the *complete* ordered list of photos the set
+    should contain, including any photos that are already members.
 
     Parameters
     ----------
     flickr : flickrapi.FlickrAPI
         Authenticated Flickr API instance.
     photoset_id : str
-        ID of the photoset to update【801413100068362†L52-L55】.
+        ID of the photoset to update.
+    primary_photo_id : str
+        ID of the photo to use as the set's primary image.  It must appear
+        in ``photo_ids``; it is prepended if missing.
     photo_ids : List[str]
-        List of photo IDs to add to the set.  Photos already in the set will
-        trigger a "photo already in set" error【801413100068362†L70-L71】, so duplicates
-        should be avoided.
+        Complete ordered list of photo IDs the set should contain.
     """
-    for pid in photo_ids:
-        flickr.photosets.addPhoto(photoset_id=photoset_id, photo_id=pid)
-        # Flickr enforces rate limits; include a short delay between calls.
-        time.sleep(0.5)
+    all_ids = list(photo_ids)
+    if primary_photo_id not in all_ids:
+        all_ids.insert(0, primary_photo_id)
+    call_api(flickr.photosets.editPhotos,
+             photoset_id=photoset_id,
+             primary_photo_id=primary_photo_id,
+             photo_ids=",".join(all_ids))
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -288,12 +599,11 @@ def main(argv: Optional[List[str]] = None) -> None:
 
     flickr = authenticate(api_key, api_secret, perms='write')
 
-    # Retrieve all photos for the user with machine tags included.
-    print(f"Searching for photos belonging to user {args.user_id}…")
-    photos = search_photos_by_user(flickr, user_id=args.user_id)
-    print(f"Retrieved {len(photos)} photos. Filtering by camera model…")
-
-    # Filter the photos by the desired camera model.
+    # Stream the user's photos straight into the camera filter: pagination,
+    # local tag matching and EXIF probes overlap, and only matching IDs are
+    # kept in memory.
+    print(f"Searching for photos belonging to user {args.user_id} and filtering by camera model…")
+    photos = iter_photos_by_user(flickr, user_id=args.user_id)
     matching_ids = filter_photos_by_camera(flickr, photos, args.camera_model)
     if not matching_ids:
         print(f"No photos found for camera model '{args.camera_model}'. Exiting.")
@@ -304,18 +614,30 @@ def main(argv: Optional[List[str]] = None) -> None:
     if args.photoset_id:
         photoset_id = args.photoset_id
         print(f"Adding photos to existing photoset {photoset_id}…")
-        add_photos_to_photoset(flickr, photoset_id, matching_ids)
-        print("Done.")
+        # Merge the current membership with the new matches so the single
+        # editPhotos call preserves existing photos (and sidesteps the
+        # "photo already in set" error that per-photo adds would raise).
+        primary_id, existing_ids = get_photoset_photos(flickr, photoset_id)
+        existing_set = set(existing_ids)
+        new_ids = [pid for pid in matching_ids if pid not in existing_set]
+        if not new_ids:
+            # Every match is already a member — skip the write call entirely.
+            print("All matching photos are already in the photoset. Nothing to do.")
+            return
+        merged_ids = existing_ids + new_ids
+        if not primary_id:
+            primary_id = merged_ids[0]
+        add_photos_to_photoset(flickr, photoset_id, primary_id, merged_ids)
+        print(f"Added {len(new_ids)} new photo(s). Done.")
     else:
-        # Use the first photo as the primary image for the new album and add
-        # the remainder afterwards.
+        # Use the first photo as the primary image for the new album; the
+        # set is created with just the primary, then filled in one batch.
         primary_id = matching_ids[0]
-        rest_ids = matching_ids[1:]
         print(f"Creating new photoset '{args.album_title}'…")
         photoset_id = create_photoset(flickr, title=args.album_title, primary_photo_id=primary_id, description=args.album_desc)
         print(f"Created photoset {photoset_id}. Adding remaining photos…")
-        if rest_ids:
-            add_photos_to_photoset(flickr, photoset_id, rest_ids)
+        if len(matching_ids) > 1:
+            add_photos_to_photoset(flickr, photoset_id, primary_id, matching_ids)
         print("All photos added.")
 
 